@@ -13,17 +13,26 @@ Features:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
+import heapq
 import itertools
+import mmap
+import multiprocessing
+import os
+import re
 import platform
 import plistlib
 import string
+import struct
 import subprocess
 import sys
 import tempfile
 import time
 import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Iterable, Iterator, List, Optional, Sequence, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Union
 
 try:
     from PyPDF2 import PdfReader
@@ -42,6 +51,36 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     py7zr = None
 
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:  # pragma: no cover - optional dependency
+    ScalableBloomFilter = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import pikepdf
+except ImportError:  # pragma: no cover - optional dependency
+    pikepdf = None
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
+try:
+    from tqdm import tqdm
+except ImportError:  # pragma: no cover - optional dependency
+    tqdm = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None
+
 
 DEFAULT_CHARSET = string.ascii_letters + string.digits
 PATTERN_CHARSETS = {
@@ -62,6 +101,50 @@ TARGET_TYPE_MAP = {
     ".iso": "iso",
 }
 SUPPORTED_TYPES = tuple(sorted(set(TARGET_TYPE_MAP.values())))
+PDF_ENGINES = ("auto", "pypdf2", "pikepdf", "pdfcrack")
+
+# Candidates are shipped to worker processes in chunks so the per-task
+# submission overhead is amortized over many crypto checks. Target types
+# whose attempts shell out or decode whole archives (~0.1-1s each) get
+# small chunks so one in-flight chunk never represents minutes of work
+# after the password has already been found.
+CHUNK_SIZE = 512
+SLOW_CHUNK_SIZE = 8
+SLOW_TARGET_TYPES = frozenset({"rar", "7z", "iso"})
+
+# How many candidates a batch tests between polls of the shared stop event.
+STOP_CHECK_INTERVAL = 4
+
+# Concurrent hdiutil attach attempts per batch on macOS.
+HDIUTIL_CONCURRENCY = 8
+
+# Batch size for vectorized candidate generation.
+GEN_BATCH = 65536
+
+# Bucket sizes that map a stream's emission rank onto a merge priority:
+# every WORDLIST_PRIORITY_BUCKET wordlist entries cost one priority step,
+# so the top of the wordlist interleaves with near-seed variants while
+# deep pattern expansion drops toward the back of the queue.
+WORDLIST_PRIORITY_BUCKET = 1000
+PATTERN_PRIORITY_BUCKET = 5000
+
+# Generators may emit str or bytes; crackers normalize at the crypto edge.
+Candidate = Union[str, bytes]
+
+
+def _as_bytes(password: Candidate) -> bytes:
+    if isinstance(password, bytes):
+        return password
+    return password.encode("utf-8")
+
+
+def _as_str(password: Candidate) -> str:
+    if isinstance(password, str):
+        return password
+    try:
+        return password.decode("utf-8")
+    except UnicodeDecodeError:
+        return password.decode("latin-1")
 
 
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
@@ -141,6 +224,40 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         choices=SUPPORTED_TYPES,
         help="Force the target type (pdf/zip/rar/7z/iso). Defaults to extension inference.",
     )
+    parser.add_argument(
+        "--wordlist-as-prior",
+        action="store_true",
+        help=(
+            "Use the wordlist as a plausibility prior: pattern/length "
+            "candidates containing a 4-gram never seen in (mangled) wordlist "
+            "entries are skipped without testing."
+        ),
+    )
+    parser.add_argument(
+        "--restart-index",
+        type=int,
+        default=0,
+        help=(
+            "Skip the first N wordlist entries, e.g. to resume an "
+            "interrupted run from a known attempt count."
+        ),
+    )
+    parser.add_argument(
+        "--engine",
+        choices=PDF_ENGINES,
+        default="auto",
+        help=(
+            "PDF verification engine: pikepdf (qpdf C++ bindings), pypdf2 "
+            "(pure Python), or the external pdfcrack CLI (wordlist only). "
+            "auto picks pikepdf when installed."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes testing candidates in parallel (default: CPU count, 1=serial).",
+    )
     return parser.parse_args(argv)
 
 
@@ -159,98 +276,603 @@ def determine_target_type(path: Path, forced: Optional[str]) -> str:
     return TARGET_TYPE_MAP.get(path.suffix.lower(), "pdf")
 
 
-def try_password(pdf_path: Path, password: str, target_type: str) -> bool:
-    if target_type == "pdf":
-        return try_pdf_password(pdf_path, password)
-    if target_type == "zip":
-        return try_zip_password(pdf_path, password)
-    if target_type == "rar":
-        return try_rar_password(pdf_path, password)
-    if target_type == "7z":
-        return try_7z_password(pdf_path, password)
-    if target_type == "iso":
-        return try_iso_password(pdf_path, password)
-    raise ValueError(f"Unsupported target type: {target_type}")
+class Cracker:
+    """Base for target-specific crackers.
 
+    Subclasses parse the expensive file structure once in ``__init__`` so the
+    per-candidate ``try_password`` only runs the actual crypto check.
+    """
 
-def try_pdf_password(pdf_path: Path, password: str) -> bool:
-    try:
-        with pdf_path.open("rb") as handle:
-            reader = PdfReader(handle)
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def try_password(self, password: Candidate) -> bool:
+        raise NotImplementedError
+
+    def try_batch(self, chunk: List[Candidate]) -> Optional[Candidate]:
+        """Test a chunk of candidates; subclasses may run them concurrently."""
+        for index, password in enumerate(chunk):
+            if index % STOP_CHECK_INTERVAL == 0 and _should_stop():
+                return None
+            if self.try_password(password):
+                return password
+        return None
+
+
+# 32-byte padding string from the PDF standard security handler
+# (PDF 1.7 spec, Algorithm 2).
+PDF_PAD = bytes(
+    [
+        0x28, 0xBF, 0x4E, 0x5E, 0x4E, 0x75, 0x8A, 0x41,
+        0x64, 0x00, 0x4E, 0x56, 0xFF, 0xFA, 0x01, 0x08,
+        0x2E, 0x2E, 0x00, 0xB6, 0xD0, 0x68, 0x3E, 0x80,
+        0x2F, 0x0C, 0xA9, 0xFE, 0x64, 0x53, 0x69, 0x7A,
+    ]
+)
+
+
+def _rc4(key: bytes, data: bytes) -> bytes:
+    state = list(range(256))
+    j = 0
+    for i in range(256):
+        j = (j + state[i] + key[i % len(key)]) & 0xFF
+        state[i], state[j] = state[j], state[i]
+    out = bytearray(len(data))
+    i = j = 0
+    for pos in range(len(data)):
+        i = (i + 1) & 0xFF
+        j = (j + state[i]) & 0xFF
+        state[i], state[j] = state[j], state[i]
+        out[pos] = data[pos] ^ state[(state[i] + state[j]) & 0xFF]
+    return bytes(out)
+
+
+def _rc4_batch(keys: "np.ndarray", data: "np.ndarray") -> "np.ndarray":
+    """RC4 over n independent keys at once, one NumPy op per lane step.
+
+    ``keys`` is (n, key_len) uint8 and ``data`` is (n, data_len) uint8; the
+    key schedule and keystream loops run their 256 + data_len steps as whole-
+    column vector operations, so the per-candidate Python overhead of the
+    scalar ``_rc4`` is paid once per batch instead of once per password.
+    """
+    n, key_len = keys.shape
+    rows = np.arange(n)
+    state = np.tile(np.arange(256, dtype=np.uint8), (n, 1))
+    j = np.zeros(n, dtype=np.intp)
+    for i in range(256):
+        j = (j + state[:, i] + keys[:, i % key_len]) & 0xFF
+        column = state[:, i].copy()
+        swapped = state[rows, j].copy()
+        state[rows, j] = column
+        state[:, i] = swapped
+    out = np.empty_like(data)
+    j = np.zeros(n, dtype=np.intp)
+    for pos in range(data.shape[1]):
+        i = (pos + 1) & 0xFF
+        j = (j + state[:, i]) & 0xFF
+        column = state[:, i].copy()
+        swapped = state[rows, j].copy()
+        state[rows, j] = column
+        state[:, i] = swapped
+        keystream = state[
+            rows, (swapped.astype(np.intp) + column.astype(np.intp)) & 0xFF
+        ]
+        out[:, pos] = data[:, pos] ^ keystream
+    return out
+
+
+class PdfCracker(Cracker):
+    """PDF verification via pikepdf (compiled qpdf) or PyPDF2 (pure Python).
+
+    With the pypdf2 engine one ``PdfReader`` is kept alive so the xref table
+    is parsed only once; pikepdf re-opens per attempt but runs the key
+    derivation in C++ against OpenSSL primitives, which is far faster.
+
+    For revision 2/3 standard-security-handler files (RC4), the encryption
+    dictionary is parsed once and candidates are verified directly with
+    hashlib/RC4 against /U (and /O for owner passwords); only confirmed hits
+    fall through to the engine. The MD5 input after the padded password —
+    O || P || ID — is constant, so it is precomputed as one tail blob.
+    """
+
+    def __init__(self, path: Path, engine: str = "auto") -> None:
+        super().__init__(path)
+        if engine == "auto":
+            engine = "pikepdf" if pikepdf is not None else "pypdf2"
+        if engine == "pikepdf" and pikepdf is None:
+            raise RuntimeError(
+                "pikepdf engine requested but pikepdf is not installed."
+            )
+        self.engine = engine
+        self.reader: Optional[PdfReader] = None
+        if engine == "pypdf2":
+            try:
+                self.reader = PdfReader(path.open("rb"))
+            except Exception:
+                self.reader = None
+        self._fast_revision = 0
+        self._load_standard_handler()
+
+    def _load_standard_handler(self) -> None:
+        """Extract /O, /U, /P, /ID once for the rev 2/3 RC4 fast path."""
+        try:
+            reader = self.reader
+            if reader is None:
+                reader = PdfReader(self.path.open("rb"))
             if not reader.is_encrypted:
-                return True
-            result = reader.decrypt(password)
-            return bool(result)
-    except Exception:
-        return False
+                return
+            encrypt = reader.trailer["/Encrypt"].get_object()
+            if encrypt.get("/Filter") != "/Standard":
+                return
+            revision = int(encrypt["/R"])
+            if revision not in (2, 3):
+                return
+            def raw_bytes(obj) -> bytes:
+                # PyPDF2 may parse these as byte or text string objects;
+                # original_bytes preserves the on-disk form for the latter.
+                obj = obj.get_object()
+                original = getattr(obj, "original_bytes", None)
+                return bytes(original if original is not None else obj)
 
+            doc_id = raw_bytes(reader.trailer["/ID"][0])
+            length = int(encrypt.get("/Length", 40))
+            self._fast_o = raw_bytes(encrypt["/O"])[:32]
+            self._fast_u = raw_bytes(encrypt["/U"])[:32]
+            self._fast_key_len = 5 if revision == 2 else max(5, length // 8)
+            self._fast_tail = (
+                self._fast_o
+                + struct.pack("<I", int(encrypt["/P"]) & 0xFFFFFFFF)
+                + doc_id
+            )
+            self._fast_u_seed = hashlib.md5(PDF_PAD + doc_id).digest()
+            self._fast_revision = revision
+        except Exception:
+            self._fast_revision = 0
 
-def try_zip_password(zip_path: Path, password: str) -> bool:
-    try:
-        with zipfile.ZipFile(zip_path) as zf:
-            member = next((info for info in zf.infolist() if not info.is_dir()), None)
-            if member is None:
-                # Archive is empty; treat as success with password
-                zf.namelist()
-                return True
-            with zf.open(member, pwd=password.encode("utf-8")) as handle:
+    def _fast_user_matches_padded(self, padded: bytes) -> bool:
+        digest = hashlib.md5(padded + self._fast_tail).digest()
+        key_len = self._fast_key_len
+        if self._fast_revision >= 3:
+            for _ in range(50):
+                digest = hashlib.md5(digest[:key_len]).digest()
+        key = digest[:key_len]
+        if self._fast_revision == 2:
+            return _rc4(key, PDF_PAD) == self._fast_u
+        checked = _rc4(key, self._fast_u_seed)
+        for i in range(1, 20):
+            checked = _rc4(bytes(b ^ i for b in key), checked)
+        return checked == self._fast_u[:16]
+
+    def _fast_owner_matches_padded(self, padded: bytes) -> bool:
+        # Algorithm 3: derive the owner RC4 key, decrypt /O back into the
+        # padded user password, then run the user check on that.
+        digest = hashlib.md5(padded).digest()
+        if self._fast_revision >= 3:
+            for _ in range(50):
+                digest = hashlib.md5(digest).digest()
+        key = digest[: self._fast_key_len]
+        if self._fast_revision == 2:
+            recovered = _rc4(key, self._fast_o)
+        else:
+            recovered = self._fast_o
+            for i in range(19, -1, -1):
+                recovered = _rc4(bytes(b ^ i for b in key), recovered)
+        return self._fast_user_matches_padded(recovered)
+
+    def _fast_password_matches(self, password: Candidate) -> Optional[bool]:
+        """Verify against /U and /O without the engine; None = undecidable."""
+        if self._fast_revision == 0:
+            return None
+        if isinstance(password, bytes):
+            pw_bytes = password
+        else:
+            try:
+                pw_bytes = password.encode("latin-1")
+            except UnicodeEncodeError:
+                return None
+        padded = (pw_bytes + PDF_PAD)[:32]
+        return self._fast_user_matches_padded(
+            padded
+        ) or self._fast_owner_matches_padded(padded)
+
+    def _fast_user_keys(self, padded_rows: List[bytes]) -> "np.ndarray":
+        """Algorithm 2 key derivation for a batch; MD5 stays in hashlib C."""
+        md5 = hashlib.md5
+        tail = self._fast_tail
+        key_len = self._fast_key_len
+        keys = np.empty((len(padded_rows), key_len), dtype=np.uint8)
+        for row, padded in enumerate(padded_rows):
+            digest = md5(padded + tail).digest()
+            if self._fast_revision >= 3:
+                for _ in range(50):
+                    digest = md5(digest[:key_len]).digest()
+            keys[row] = np.frombuffer(digest, dtype=np.uint8, count=key_len)
+        return keys
+
+    def _fast_user_mask(self, padded_rows: List[bytes]) -> "np.ndarray":
+        """Batched Algorithm 2 check; returns a bool row mask against /U."""
+        n = len(padded_rows)
+        keys = self._fast_user_keys(padded_rows)
+        if self._fast_revision == 2:
+            pad = np.frombuffer(PDF_PAD, dtype=np.uint8)
+            checked = _rc4_batch(keys, np.tile(pad, (n, 1)))
+            expected = np.frombuffer(self._fast_u, dtype=np.uint8, count=32)
+        else:
+            seed = np.frombuffer(self._fast_u_seed, dtype=np.uint8)
+            checked = np.tile(seed, (n, 1))
+            for i in range(20):
+                checked = _rc4_batch(keys ^ i, checked)
+            expected = np.frombuffer(self._fast_u, dtype=np.uint8, count=16)
+        return (checked == expected).all(axis=1)
+
+    def _fast_owner_mask(self, padded_rows: List[bytes]) -> "np.ndarray":
+        """Batched Algorithm 3: RC4-decrypt /O, then user-check the result."""
+        md5 = hashlib.md5
+        key_len = self._fast_key_len
+        n = len(padded_rows)
+        keys = np.empty((n, key_len), dtype=np.uint8)
+        for row, padded in enumerate(padded_rows):
+            digest = md5(padded).digest()
+            if self._fast_revision >= 3:
+                for _ in range(50):
+                    digest = md5(digest).digest()
+            keys[row] = np.frombuffer(digest, dtype=np.uint8, count=key_len)
+        recovered = np.tile(np.frombuffer(self._fast_o, dtype=np.uint8), (n, 1))
+        if self._fast_revision == 2:
+            recovered = _rc4_batch(keys, recovered)
+        else:
+            for i in range(19, -1, -1):
+                recovered = _rc4_batch(keys ^ i, recovered)
+        return self._fast_user_mask([recovered[row].tobytes() for row in range(n)])
+
+    def try_batch(self, chunk: List[Candidate]) -> Optional[Candidate]:
+        if self._fast_revision == 0 or np is None:
+            return super().try_batch(chunk)
+        if _should_stop():
+            return None
+        # Screen the whole chunk data-parallel: the RC4 lanes run as column
+        # vector ops across candidates, so only screened survivors (real hits
+        # plus non-latin-1 strings the fast path cannot judge) reach the
+        # engine for confirmation.
+        rows: List[int] = []
+        padded_rows: List[bytes] = []
+        survivors: Set[int] = set()
+        for index, password in enumerate(chunk):
+            if isinstance(password, bytes):
+                pw_bytes = password
+            else:
+                try:
+                    pw_bytes = password.encode("latin-1")
+                except UnicodeEncodeError:
+                    survivors.add(index)
+                    continue
+            rows.append(index)
+            padded_rows.append((pw_bytes + PDF_PAD)[:32])
+        if padded_rows:
+            mask = self._fast_user_mask(padded_rows)
+            mask |= self._fast_owner_mask(padded_rows)
+            survivors.update(
+                index for index, hit in zip(rows, mask) if hit
+            )
+        for index in sorted(survivors):
+            if self.try_password(chunk[index]):
+                return chunk[index]
+        return None
+
+    def try_password(self, password: Candidate) -> bool:
+        fast = self._fast_password_matches(password)
+        if fast is False:
+            return False
+        pw = _as_str(password)
+        if self.engine == "pikepdf":
+            try:
+                with pikepdf.open(self.path, password=pw):
+                    return True
+            except pikepdf.PasswordError:
+                return False
+            except Exception:
+                return False
+        if self.reader is None:
+            return False
+        if not self.reader.is_encrypted:
+            return True
+        try:
+            return bool(self.reader.decrypt(pw))
+        except Exception:
+            return False
+
+
+def _make_crc_table() -> List[int]:
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xEDB88320 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+def _zipcrypto_header_matches(password, header, check, table) -> bool:
+    """Run the ZipCrypto key schedule over the 12-byte encryption header.
+
+    The last decrypted header byte must equal the check byte, which rejects
+    255/256 wrong passwords without touching the archive. Written so the
+    same body compiles under numba.njit when numba is available.
+    """
+    key0 = 0x12345678
+    key1 = 0x23456789
+    key2 = 0x34567890
+    for i in range(len(password)):
+        key0 = (key0 >> 8) ^ table[(key0 ^ password[i]) & 0xFF]
+        key1 = (key1 + (key0 & 0xFF)) & 0xFFFFFFFF
+        key1 = (key1 * 134775813 + 1) & 0xFFFFFFFF
+        key2 = ((key2 >> 8) ^ table[(key2 ^ (key1 >> 24)) & 0xFF]) & 0xFFFFFFFF
+    plain = 0
+    for i in range(len(header)):
+        keyed = (key2 & 0xFFFF) | 2
+        plain = (header[i] ^ ((keyed * (keyed ^ 1)) >> 8)) & 0xFF
+        key0 = (key0 >> 8) ^ table[(key0 ^ plain) & 0xFF]
+        key1 = (key1 + (key0 & 0xFF)) & 0xFFFFFFFF
+        key1 = (key1 * 134775813 + 1) & 0xFFFFFFFF
+        key2 = ((key2 >> 8) ^ table[(key2 ^ (key1 >> 24)) & 0xFF]) & 0xFFFFFFFF
+    return plain == check
+
+
+def _expand_positions(seed_arr, pools_arr, widths, positions, out):
+    """Fill ``out`` with every substitution of ``positions`` in the seed.
+
+    Odometer over the selected positions with the rightmost position
+    advancing fastest, matching itertools.product ordering. Compiled with
+    numba.njit when numba is available.
+    """
+    count = out.shape[0]
+    length = seed_arr.shape[0]
+    for row in range(count):
+        for col in range(length):
+            out[row, col] = seed_arr[col]
+        remainder = row
+        for k in range(positions.shape[0] - 1, -1, -1):
+            pos = positions[k]
+            width = widths[pos]
+            out[row, pos] = pools_arr[pos, remainder % width]
+            remainder //= width
+
+
+_ZIP_CRC_TABLE = _make_crc_table()
+if numba is not None:
+    _ZIP_CRC_TABLE_ARR = np.array(_ZIP_CRC_TABLE, dtype=np.int64)
+    _zipcrypto_header_matches_fast = numba.njit(cache=True)(_zipcrypto_header_matches)
+    _expand_positions_fast = numba.njit(cache=True)(_expand_positions)
+else:
+    _ZIP_CRC_TABLE_ARR = None
+    _zipcrypto_header_matches_fast = None
+    _expand_positions_fast = None
+
+
+class ZipCracker(Cracker):
+    """Caches the ``ZipFile`` and first member instead of re-reading the
+    central directory per attempt."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        try:
+            self.zf: Optional[zipfile.ZipFile] = zipfile.ZipFile(path)
+            self.member = next(
+                (info for info in self.zf.infolist() if not info.is_dir()), None
+            )
+        except (zipfile.BadZipFile, zipfile.LargeZipFile):
+            self.zf = None
+            self.member = None
+        self._zipcrypto_header: Optional[bytes] = None
+        self._zipcrypto_check = 0
+        self._zipcrypto_header_arr = None
+        if self.member is not None:
+            self._load_zipcrypto_header(path)
+
+    def _load_zipcrypto_header(self, path: Path) -> None:
+        """Cache the 12-byte ZipCrypto header and check byte of the first
+        member so wrong passwords can be rejected without opening the
+        archive. AES (method 99) and strong-encryption entries are skipped."""
+        info = self.member
+        encrypted = bool(info.flag_bits & 0x1)
+        strong = bool(info.flag_bits & 0x40)
+        if not encrypted or strong or info.compress_type == 99:
+            return
+        try:
+            with path.open("rb") as raw:
+                raw.seek(info.header_offset)
+                local = raw.read(30)
+                if len(local) < 30 or local[:4] != b"PK\x03\x04":
+                    return
+                name_len = int.from_bytes(local[26:28], "little")
+                extra_len = int.from_bytes(local[28:30], "little")
+                raw.seek(info.header_offset + 30 + name_len + extra_len)
+                header = raw.read(12)
+        except OSError:
+            return
+        if len(header) != 12:
+            return
+        self._zipcrypto_header = header
+        if info.flag_bits & 0x8:
+            # Data-descriptor entries check the high byte of the DOS mtime.
+            dostime = int.from_bytes(local[10:12], "little")
+            self._zipcrypto_check = (dostime >> 8) & 0xFF
+        else:
+            self._zipcrypto_check = (info.CRC >> 24) & 0xFF
+        if _zipcrypto_header_matches_fast is not None:
+            self._zipcrypto_header_arr = np.frombuffer(header, dtype=np.uint8)
+
+    def _zipcrypto_plausible(self, pw_bytes: bytes) -> bool:
+        if self._zipcrypto_header is None:
+            return True
+        if self._zipcrypto_header_arr is not None:
+            return bool(
+                _zipcrypto_header_matches_fast(
+                    np.frombuffer(pw_bytes, dtype=np.uint8),
+                    self._zipcrypto_header_arr,
+                    self._zipcrypto_check,
+                    _ZIP_CRC_TABLE_ARR,
+                )
+            )
+        return _zipcrypto_header_matches(
+            pw_bytes, self._zipcrypto_header, self._zipcrypto_check, _ZIP_CRC_TABLE
+        )
+
+    def try_password(self, password: Candidate) -> bool:
+        if self.zf is None:
+            return False
+        if self.member is None:
+            # Archive is empty; treat as success with password
+            return True
+        pw_bytes = _as_bytes(password)
+        if not self._zipcrypto_plausible(pw_bytes):
+            return False
+        # Header check passed (or was unavailable): confirm the slow way.
+        try:
+            with self.zf.open(self.member, pwd=pw_bytes) as handle:
                 handle.read(1)
-        return True
-    except (RuntimeError, zipfile.BadZipFile, zipfile.LargeZipFile):
-        return False
-    except Exception:
-        return False
+            return True
+        except Exception:
+            return False
 
 
-def try_rar_password(rar_path: Path, password: str) -> bool:
-    if rarfile is None:
-        raise RuntimeError("rarfile dependency missing. Install via pip.")
-    try:
-        with rarfile.RarFile(rar_path) as rf:
-            member = next((info for info in rf.infolist() if not info.isdir()), None)
-            if member is None:
-                rf.testrar()
+class RarCracker(Cracker):
+    """Caches the ``RarFile`` and first member across attempts."""
+
+    def __init__(self, path: Path) -> None:
+        if rarfile is None:
+            raise RuntimeError("rarfile dependency missing. Install via pip.")
+        super().__init__(path)
+        try:
+            self.rf: Optional["rarfile.RarFile"] = rarfile.RarFile(path)
+            self.member = next(
+                (info for info in self.rf.infolist() if not info.isdir()), None
+            )
+        except rarfile.Error:
+            self.rf = None
+            self.member = None
+
+    def try_password(self, password: Candidate) -> bool:
+        if self.rf is None:
+            return False
+        try:
+            if self.member is None:
+                self.rf.testrar()
                 return True
-            with rf.open(member, pwd=password) as handle:
+            with self.rf.open(self.member, pwd=_as_str(password)) as handle:
                 handle.read(1)
-        return True
-    except (rarfile.BadRarFile, rarfile.RarWrongPassword, rarfile.RarCRCError):
-        return False
-    except rarfile.RarCannotExec as exc:
-        raise RuntimeError(
-            "rarfile requires 'unrar' or 'rar' command to be installed."
-        ) from exc
-    except Exception:
-        return False
+            return True
+        except (rarfile.BadRarFile, rarfile.RarWrongPassword, rarfile.RarCRCError):
+            return False
+        except rarfile.RarCannotExec as exc:
+            raise RuntimeError(
+                "rarfile requires 'unrar' or 'rar' command to be installed."
+            ) from exc
+        except Exception:
+            return False
 
 
-def try_7z_password(archive_path: Path, password: str) -> bool:
-    if py7zr is None:
-        raise RuntimeError("py7zr dependency missing. Install via pip.")
-    try:
-        with py7zr.SevenZipFile(archive_path, mode="r", password=password) as archive:
-            names = archive.getnames()
-            if not names:
-                archive.list()
-            else:
-                target = names[0]
-                archive.read([target])
-        return True
-    except (py7zr.exceptions.PasswordRequired, py7zr.exceptions.Bad7zFile):
-        return False
-    except py7zr.exceptions.UnsupportedCompressionMethodError:
-        return False
-    except RuntimeError as exc:
-        if "password" in str(exc).lower():
+class SevenZipCracker(Cracker):
+    """py7zr binds the password at open time, so the archive header has to be
+    re-read per attempt; only the path checks are hoisted."""
+
+    def __init__(self, path: Path) -> None:
+        if py7zr is None:
+            raise RuntimeError("py7zr dependency missing. Install via pip.")
+        super().__init__(path)
+
+    def try_password(self, password: Candidate) -> bool:
+        try:
+            with py7zr.SevenZipFile(
+                self.path, mode="r", password=_as_str(password)
+            ) as archive:
+                names = archive.getnames()
+                if not names:
+                    archive.list()
+                elif hasattr(archive, "read"):
+                    archive.read([names[0]])
+                else:
+                    # py7zr >= 1.0 dropped read(); testzip() decrypts and
+                    # CRC-checks members, failing on a wrong password.
+                    if archive.testzip() is not None:
+                        return False
+            return True
+        except (py7zr.exceptions.PasswordRequired, py7zr.exceptions.Bad7zFile):
+            return False
+        except py7zr.exceptions.UnsupportedCompressionMethodError:
+            return False
+        except RuntimeError as exc:
+            if "password" in str(exc).lower():
+                return False
+            return False
+        except Exception:
+            # Wrong passwords surface as decompression/CRC errors.
             return False
-        return False
 
 
-def try_iso_password(iso_path: Path, password: str) -> bool:
-    system = platform.system()
-    if system == "Darwin":
-        return try_iso_hdiutil(iso_path, password)
-    return try_iso_with_7z_cli(iso_path, password)
+class IsoCracker(Cracker):
+    """Dispatches to hdiutil on macOS and 7z elsewhere.
+
+    Forking the 7z CLI per candidate costs far more than the crypto check
+    itself, so on non-macOS the image is probed once with py7zr: if it is a
+    7z-family archive (most password-protected "ISOs" are), attempts run
+    in-process through SevenZipCracker and the subprocess path is only a
+    fallback for formats py7zr cannot read. The stock 7z binary offers no
+    way to pipe many passwords into one long-lived process.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.use_hdiutil = platform.system() == "Darwin"
+        self._sevenzip: Optional[SevenZipCracker] = None
+        if not self.use_hdiutil and py7zr is not None:
+            try:
+                with py7zr.SevenZipFile(path, mode="r") as archive:
+                    archive.getnames()
+                self._sevenzip = SevenZipCracker(path)
+            except py7zr.exceptions.PasswordRequired:
+                self._sevenzip = SevenZipCracker(path)
+            except Exception:
+                self._sevenzip = None
+
+    def try_password(self, password: Candidate) -> bool:
+        if self.use_hdiutil:
+            return try_iso_hdiutil(self.path, _as_str(password))
+        if self._sevenzip is not None:
+            return self._sevenzip.try_password(password)
+        return try_iso_with_7z_cli(self.path, _as_str(password))
+
+    def try_batch(self, chunk: List[Candidate]) -> Optional[Candidate]:
+        if not self.use_hdiutil:
+            return super().try_batch(chunk)
+        if _should_stop():
+            return None
+        # hdiutil spends its time in the attach subprocess, so a handful of
+        # concurrent attempts scale with cores instead of running serially.
+        return asyncio.run(
+            try_iso_hdiutil_batch(
+                self.path, [_as_str(pw) for pw in chunk], HDIUTIL_CONCURRENCY
+            )
+        )
+
+
+def make_cracker(path: Path, target_type: str, engine: str = "auto") -> Cracker:
+    if target_type == "pdf":
+        return PdfCracker(path, engine=engine)
+    if target_type == "zip":
+        return ZipCracker(path)
+    if target_type == "rar":
+        return RarCracker(path)
+    if target_type == "7z":
+        return SevenZipCracker(path)
+    if target_type == "iso":
+        return IsoCracker(path)
+    raise ValueError(f"Unsupported target type: {target_type}")
+
+
+def try_password(pdf_path: Path, password: Candidate, target_type: str) -> bool:
+    """One-shot convenience wrapper; hot loops reuse a single cracker."""
+    return make_cracker(pdf_path, target_type).try_password(password)
 
 
 def try_iso_hdiutil(iso_path: Path, password: str) -> bool:
@@ -292,6 +914,76 @@ def try_iso_hdiutil(iso_path: Path, password: str) -> bool:
         return False
 
 
+async def _try_iso_hdiutil_async(iso_path: Path, password: str) -> bool:
+    """One hdiutil attach attempt as an asyncio subprocess."""
+    try:
+        with tempfile.TemporaryDirectory() as mount_dir:
+            proc = await asyncio.create_subprocess_exec(
+                "hdiutil",
+                "attach",
+                "-plist",
+                "-nobrowse",
+                "-readonly",
+                "-mountpoint",
+                mount_dir,
+                "-stdinpass",
+                str(iso_path),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, _ = await proc.communicate((password + "\n").encode("utf-8"))
+            if proc.returncode != 0:
+                return False
+            plist_data = plistlib.loads(stdout)
+            devices = [
+                entity.get("dev-entry")
+                for entity in plist_data.get("system-entities", [])
+                if entity.get("dev-entry")
+            ]
+            for device in devices:
+                detach = await asyncio.create_subprocess_exec(
+                    "hdiutil",
+                    "detach",
+                    device,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                await detach.communicate()
+            return True
+    except FileNotFoundError as exc:
+        raise RuntimeError("hdiutil not found. ISO/DMG testing requires macOS.") from exc
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        return False
+
+
+async def try_iso_hdiutil_batch(
+    iso_path: Path, passwords: List[str], concurrency: int = HDIUTIL_CONCURRENCY
+) -> Optional[str]:
+    """Drive up to ``concurrency`` hdiutil attempts at once; first hit wins."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def attempt(password: str) -> tuple[str, bool]:
+        async with semaphore:
+            return password, await _try_iso_hdiutil_async(iso_path, password)
+
+    tasks = [asyncio.create_task(attempt(password)) for password in passwords]
+    found: Optional[str] = None
+    try:
+        for completed in asyncio.as_completed(tasks):
+            password, matched = await completed
+            if matched:
+                found = password
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return found
+
+
 def try_iso_with_7z_cli(iso_path: Path, password: str) -> bool:
     """
     For Linux/Windows we rely on the external `7z` command (from p7zip).
@@ -310,7 +1002,39 @@ def try_iso_with_7z_cli(iso_path: Path, password: str) -> bool:
     return proc.returncode == 0
 
 
+def run_pdfcrack(pdf_path: Path, wordlist: Path) -> Optional[str]:
+    """Run the external ``pdfcrack`` CLI against a wordlist in one shot."""
+    try:
+        proc = subprocess.run(
+            ["pdfcrack", "-w", str(wordlist), str(pdf_path)],
+            capture_output=True,
+            check=False,
+            text=True,
+        )
+    except FileNotFoundError as exc:
+        raise RuntimeError(
+            "pdfcrack executable not found. Install pdfcrack to use --engine pdfcrack."
+        ) from exc
+    match = re.search(r"found user-password: '(.*)'", proc.stdout)
+    if match:
+        return match.group(1)
+    return None
+
+
 def candidate_variants(seed: str) -> Iterator[str]:
+    """Yield mutations of ``seed`` ordered by increasing Hamming distance.
+
+    Candidates differing from the seed in fewer positions are emitted first,
+    so near-misses (single typos, one swapped case) are tried before variants
+    that rewrite most of the guess.
+    """
+    for _, candidate in candidate_variants_ranked(seed):
+        yield candidate
+
+
+def candidate_variants_ranked(seed: str) -> Iterator[tuple[int, str]]:
+    """Like :func:`candidate_variants`, but pairs each variant with its
+    Hamming distance from the seed for priority-based stream merging."""
     substitutions = {
         "0": "oO",
         "1": "lLI!",
@@ -321,21 +1045,109 @@ def candidate_variants(seed: str) -> Iterator[str]:
     }
     pools: List[List[str]] = []
     for char in seed:
-        options: Set[str] = {char}
+        options: Set[str] = set()
         if char.isalpha():
             options.add(char.swapcase())
         if char.isdigit():
             prev_digit = str((int(char) - 1) % 10)
             next_digit = str((int(char) + 1) % 10)
             options.update({prev_digit, next_digit})
-        for repl in substitutions.get(char, ""):
-            options.add(repl)
-        pools.append(sorted(options))
-    for combo in itertools.product(*pools):
-        yield "".join(combo)
+        options.update(substitutions.get(char, ""))
+        options.discard(char)
+        # Seed character first, alternatives after it.
+        pools.append([char] + sorted(options))
+    if _expand_positions_fast is not None:
+        try:
+            yield from _candidate_variants_ranked_numba(seed, pools)
+            return
+        except UnicodeEncodeError:
+            pass
+    seed_chars = list(seed)
+    for distance in range(len(seed) + 1):
+        for positions in itertools.combinations(range(len(seed)), distance):
+            alternatives = [pools[pos][1:] for pos in positions]
+            for replacement in itertools.product(*alternatives):
+                chars = seed_chars.copy()
+                for pos, repl in zip(positions, replacement):
+                    chars[pos] = repl
+                yield distance, "".join(chars)
+
+
+def _candidate_variants_ranked_numba(
+    seed: str, pools: List[List[str]]
+) -> Iterator[tuple[int, str]]:
+    """Expand each position combination with the compiled odometer kernel,
+    emitting whole (count, len(seed)) uint8 blocks instead of joining
+    per-variant tuples in the interpreter."""
+    seed_arr = np.frombuffer(seed.encode("latin-1"), dtype=np.uint8)
+    alternatives = [
+        [option.encode("latin-1") for option in pool[1:]] for pool in pools
+    ]
+    length = len(seed)
+    widths = np.array([len(alts) for alts in alternatives], dtype=np.int64)
+    pools_arr = np.zeros((length, max(int(widths.max()), 1) if length else 1), dtype=np.uint8)
+    for pos, alts in enumerate(alternatives):
+        for slot, option in enumerate(alts):
+            pools_arr[pos, slot] = option[0]
+    for distance in range(length + 1):
+        for positions in itertools.combinations(range(length), distance):
+            count = 1
+            for pos in positions:
+                count *= int(widths[pos])
+            if count == 0:
+                continue
+            out = np.empty((count, length), dtype=np.uint8)
+            _expand_positions_fast(
+                seed_arr,
+                pools_arr,
+                widths,
+                np.array(positions, dtype=np.int64),
+                out,
+            )
+            flat = out.tobytes()
+            for offset in range(0, count * length, length):
+                yield distance, flat[offset : offset + length].decode("latin-1")
+
+
+# Patterns longer than this keep the generic product() path; the codegen'd
+# source would otherwise nest too deeply to be worth compiling.
+PATTERN_CODEGEN_MAX_DEPTH = 16
+
+
+def _compile_pattern_generator(
+    char_sets_bytes: List[bytes],
+) -> Iterator[bytes]:
+    """Build a specialized nested-loop generator for one pattern via exec().
+
+    The pattern is fixed at startup but iterated millions of times, so the
+    per-element dispatch of itertools.product is pure overhead. Unrolling the
+    loops into dedicated source lets CPython compile one concatenation
+    expression per candidate with no tuple allocation in between.
+    """
+    depth_count = len(char_sets_bytes)
+    lines = ["def _gen():"]
+    for depth in range(depth_count):
+        indent = "    " * (depth + 1)
+        lines.append(indent + f"for c{depth} in cs{depth}:")
+        # Accumulate the prefix at each level so inner iterations pay for a
+        # single concatenation instead of re-joining the whole candidate.
+        if depth < depth_count - 1:
+            prefix = f"p{depth - 1} + c{depth}" if depth else f"c{depth}"
+            lines.append(indent + f"    p{depth} = {prefix}")
+    last = depth_count - 1
+    tail = f"p{last - 1} + c{last}" if last else f"c{last}"
+    lines.append("    " * (depth_count + 1) + "yield " + tail)
+    namespace: Dict[str, object] = {
+        # Pre-split each position's charset into single-byte bytes objects so
+        # the loop body concatenates bytes directly instead of ints.
+        f"cs{i}": [cs[j : j + 1] for j in range(len(cs))]
+        for i, cs in enumerate(char_sets_bytes)
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["_gen"]()
 
 
-def generate_from_pattern(pattern: str, *, order: str = "asc") -> Iterator[str]:
+def generate_from_pattern(pattern: str, *, order: str = "asc") -> Iterator[Candidate]:
     char_sets: List[str] = []
     for char in pattern:
         charset = PATTERN_CHARSETS.get(char)
@@ -343,16 +1155,96 @@ def generate_from_pattern(pattern: str, *, order: str = "asc") -> Iterator[str]:
             char_sets.append(char)
         else:
             char_sets.append(charset if order == "asc" else charset[::-1])
-    for combo in itertools.product(*char_sets):
-        yield "".join(combo)
+    try:
+        char_sets_bytes = [charset.encode("latin-1") for charset in char_sets]
+    except UnicodeEncodeError:
+        # Non-latin-1 literals: fall back to the str join path.
+        for combo in itertools.product(*char_sets):
+            yield "".join(combo)
+        return
+    if 0 < len(char_sets_bytes) <= PATTERN_CODEGEN_MAX_DEPTH:
+        yield from _compile_pattern_generator(char_sets_bytes)
+        return
+    # product() over bytes yields int tuples which bytes() concatenates in C,
+    # skipping the per-candidate str join and the later .encode() round trip.
+    for combo in itertools.product(*char_sets_bytes):
+        yield bytes(combo)
+
+
+def generate_by_length(length: int, charset: str) -> Iterator[Candidate]:
+    try:
+        charset_bytes = charset.encode("latin-1")
+    except UnicodeEncodeError:
+        # Non-latin-1 charsets keep the generic str path.
+        for combo in itertools.product(charset, repeat=length):
+            yield "".join(combo)
+        return
+    if np is not None and length * max(len(charset_bytes), 2).bit_length() < 62:
+        yield from _generate_by_length_numpy(length, charset_bytes)
+        return
+    yield from _generate_by_length_odometer(length, charset_bytes)
+
+
+def _generate_by_length_odometer(
+    length: int, charset_bytes: bytes
+) -> Iterator[bytes]:
+    """Mixed-radix odometer mutating one shared bytearray in place.
 
+    Instead of allocating a length-element tuple plus a joined string per
+    candidate, only the positions that change are rewritten — amortized one
+    byte per step — and a bytes snapshot is yielded.
+    """
+    base = len(charset_bytes)
+    if base == 0 and length > 0:
+        return
+    buf = bytearray(charset_bytes[:1] * length)
+    indices = [0] * length
+    yield bytes(buf)
+    for _ in range(base**length - 1):
+        pos = length - 1
+        while True:
+            indices[pos] += 1
+            if indices[pos] < base:
+                buf[pos] = charset_bytes[indices[pos]]
+                break
+            indices[pos] = 0
+            buf[pos] = charset_bytes[0]
+            pos -= 1
+        yield bytes(buf)
 
-def generate_by_length(length: int, charset: str) -> Iterator[str]:
-    for combo in itertools.product(charset, repeat=length):
-        yield "".join(combo)
 
+def _generate_by_length_numpy(length: int, charset_bytes: bytes) -> Iterator[bytes]:
+    """Materialize candidates in bulk instead of joining per-character tuples.
 
-def limited(generator: Iterable[str], limit: Optional[int]) -> Iterator[str]:
+    A vectorized odometer converts a batch of combination counters into
+    charset indices at once; the gathered uint8 matrix becomes one flat byte
+    buffer that is sliced per candidate.
+    """
+    charset_arr = np.frombuffer(charset_bytes, dtype=np.uint8)
+    base = len(charset_bytes)
+    total = base**length
+    # Structure-of-arrays working set: one counter vector, one index matrix,
+    # and one contiguous byte buffer indexed by candidate id, all allocated
+    # once and refilled in place so per-batch allocator traffic is zero.
+    batch = min(GEN_BATCH, total)
+    remainders = np.empty(batch, dtype=np.int64)
+    indices = np.empty((batch, length), dtype=np.int64)
+    out = np.empty((batch, length), dtype=np.uint8)
+    for start in range(0, total, GEN_BATCH):
+        count = min(GEN_BATCH, total - start)
+        rem = remainders[:count]
+        idx = indices[:count]
+        rem[:] = np.arange(start, start + count, dtype=np.int64)
+        for pos in range(length - 1, -1, -1):
+            np.mod(rem, base, out=idx[:, pos])
+            np.floor_divide(rem, base, out=rem)
+        np.take(charset_arr, idx, out=out[:count])
+        flat = out[:count].tobytes()
+        for offset in range(0, count * length, length):
+            yield flat[offset : offset + length]
+
+
+def limited(generator: Iterable[Candidate], limit: Optional[int]) -> Iterator[Candidate]:
     if limit is None:
         yield from generator
         return
@@ -362,62 +1254,390 @@ def limited(generator: Iterable[str], limit: Optional[int]) -> Iterator[str]:
         yield candidate
 
 
-def read_wordlist(path: Path) -> Iterator[str]:
-    with path.open("r", encoding="utf-8", errors="ignore") as handle:
-        for line in handle:
-            word = line.strip()
+def prioritized(
+    generator: Iterable[Candidate], bucket: int, exact: bool
+) -> Iterator[tuple[int, Candidate, bool]]:
+    """Tag candidates with a rank-derived priority for heapq.merge."""
+    for index, candidate in enumerate(generator):
+        yield (index // bucket, candidate, exact)
+
+
+def batched(generator: Iterable[Candidate], size: int) -> Iterator[List[Candidate]]:
+    iterator = iter(generator)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _chunk_size_for(target_type: str) -> int:
+    return SLOW_CHUNK_SIZE if target_type in SLOW_TARGET_TYPES else CHUNK_SIZE
+
+
+LEET_TRANSLATION = bytes.maketrans(b"aeiostb", b"4310578")
+
+
+def build_wordlist_prior(path: Path):
+    """Collect the 4-grams of every wordlist entry and its cheap mangles.
+
+    The result acts as a plausibility filter for generated candidates: a
+    brute-force candidate containing a 4-gram that never occurs in any
+    mangled wordlist entry is unlikely to be a human-chosen password and
+    can be skipped without a crypto check.
+    """
+    if ScalableBloomFilter is not None:
+        grams = ScalableBloomFilter(initial_capacity=1 << 20, error_rate=1e-3)
+    else:
+        grams = set()
+    for word in read_wordlist(path):
+        lowered = word.lower()
+        for mangled in (
+            word,
+            lowered,
+            word.upper(),
+            lowered.capitalize(),
+            lowered.translate(LEET_TRANSLATION),
+        ):
+            for i in range(len(mangled) - 3):
+                grams.add(mangled[i : i + 4])
+    return grams
+
+
+def plausible_by_prior(
+    generator: Iterable[Candidate], prior
+) -> Iterator[Candidate]:
+    """Drop candidates containing a 4-gram absent from the wordlist prior."""
+    for candidate in generator:
+        key = _as_bytes(candidate)
+        if len(key) >= 4 and any(
+            key[i : i + 4] not in prior for i in range(len(key) - 3)
+        ):
+            continue
+        yield candidate
+
+
+def _wordlist_line_starts(path: Path) -> "np.ndarray":
+    """Byte offsets of every line start, cached beside the wordlist.
+
+    The int64 offsets array is persisted to ``<wordlist>.idx`` so restarted
+    runs seek straight to entry N instead of re-tokenizing the file; a stale
+    index (older than the wordlist) is rebuilt.
+    """
+    idx_path = path.with_name(path.name + ".idx")
+    try:
+        if idx_path.stat().st_mtime >= path.stat().st_mtime:
+            return np.fromfile(idx_path, dtype=np.int64)
+    except OSError:
+        pass
+    with path.open("rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as view:
+        data = np.frombuffer(view, dtype=np.uint8)
+        starts = np.flatnonzero(data == 10).astype(np.int64) + 1
+        # Drop the frombuffer view so the mmap can close on block exit.
+        del data
+    starts = np.concatenate((np.zeros(1, dtype=np.int64), starts))
+    # A trailing newline leaves a phantom start at EOF.
+    starts = starts[starts < path.stat().st_size]
+    try:
+        starts.tofile(idx_path)
+    except OSError:
+        pass  # read-only wordlist directory: index just isn't cached
+    return starts
+
+
+def read_wordlist(path: Path, start: int = 0) -> Iterator[bytes]:
+    # Words stay bytes from disk to crypto: no per-line decode, and no
+    # re-encode before zf.open(pwd=...). Crackers that want str (PDF, RAR,
+    # 7z, ISO) decode at their edge only.
+    size = path.stat().st_size
+    if np is not None and size:
+        # Memory-mapped with an offsets index: entry N is one slice away, so
+        # --restart-index resumes without streaming past skipped lines, and
+        # only the touched pages of an oversized wordlist are faulted in.
+        starts = _wordlist_line_starts(path)
+        with path.open("rb") as handle, mmap.mmap(
+            handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as view:
+            count = len(starts)
+            for index in range(start, count):
+                begin = starts[index]
+                end = starts[index + 1] - 1 if index + 1 < count else size
+                word = bytes(view[begin:end]).strip(b" \t\r\n")
+                if word:
+                    yield word
+        return
+    with path.open("rb") as handle:
+        for lineno, line in enumerate(handle):
+            if lineno < start:
+                continue
+            word = line.strip(b" \t\r\n")
             if word:
                 yield word
 
 
+class _PrintProgress:
+    """Fallback progress reporter mimicking tqdm's update/close API."""
+
+    def __init__(self) -> None:
+        self.n = 0
+        self._last_logged = 0
+
+    def update(self, count: int) -> None:
+        self.n += count
+        if self.n - self._last_logged >= 500:
+            self._last_logged = self.n
+            print(f"[+] Tried {self.n} candidates...", flush=True)
+
+    def close(self) -> None:
+        pass
+
+
+def _make_progress():
+    if tqdm is not None:
+        return tqdm(desc="candidates", unit="pw", miniters=500, mininterval=0.5)
+    return _PrintProgress()
+
+
+# Per-worker cracker set up once by _worker_init so each process keeps a
+# long-lived handle on the target instead of re-opening it per candidate.
+_worker_cracker: Optional[Cracker] = None
+
+# Cooperative cancellation flag shared across the pool: set once a hit is
+# found so in-flight batches abort instead of grinding through the rest of
+# their chunk.
+_stop_event = None
+
+
+def _should_stop() -> bool:
+    return _stop_event is not None and _stop_event.is_set()
+
+
+def _worker_init(
+    target_path: Path,
+    target_type: str,
+    engine: str,
+    stop_event=None,
+) -> None:
+    global _worker_cracker, _stop_event
+    _worker_cracker = make_cracker(target_path, target_type, engine=engine)
+    _stop_event = stop_event
+
+
+def _try_batch(chunk: List[Candidate]) -> Optional[Candidate]:
+    if _worker_cracker is None:
+        return None
+    return _worker_cracker.try_batch(chunk)
+
+
+def _crack_parallel(
+    candidates: Iterable[Candidate],
+    target_path: Path,
+    target_type: str,
+    workers: int,
+    engine: str = "auto",
+) -> Optional[Candidate]:
+    found: Optional[Candidate] = None
+    progress = _make_progress()
+    chunks = batched(candidates, _chunk_size_for(target_type))
+    stop_event = multiprocessing.Event()
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_worker_init,
+        initargs=(target_path, target_type, engine, stop_event),
+    )
+    pending: Dict[Future, List[Candidate]] = {}
+    try:
+        while found is None:
+            # Keep a bounded submission window so huge candidate streams
+            # are not materialized as queued futures all at once.
+            for chunk in itertools.islice(
+                chunks, max(0, workers * 2 - len(pending))
+            ):
+                pending[executor.submit(_try_batch, chunk)] = chunk
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = pending.pop(future)
+                progress.update(len(chunk))
+                result = future.result()
+                if result is not None and found is None:
+                    found = result
+                    stop_event.set()
+    finally:
+        # Abort in-flight batches, then return without joining the pool:
+        # workers notice the event within a few attempts and exit on their
+        # own, so a hit is reported immediately even when each attempt is
+        # an expensive subprocess or archive decode.
+        stop_event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        progress.close()
+    return found
+
+
+class _HashDedup:
+    """Dedup on 64-bit candidate hashes kept in one sorted uint64 array.
+
+    Instead of interning whole candidate strings in a set, only the xxh64
+    digest of each candidate is stored — 8 contiguous bytes per entry with
+    bisect membership, so the working set stays an order of magnitude
+    smaller and cache-friendly. Fresh digests collect in a small set and
+    are merged into the sorted array in batches to amortize the O(n)
+    insertion cost. The odds of a 64-bit collision silently skipping a
+    candidate over a 250k-candidate run are around 1e-14, far below the
+    Bloom filter's configured error rate.
+    """
+
+    MERGE_BATCH = 1024
+
+    def __init__(self) -> None:
+        self._sorted = np.empty(0, dtype=np.uint64)
+        self._pending: Set[int] = set()
+
+    def add(self, key: bytes) -> bool:
+        """Record ``key``; returns False when it was seen before."""
+        digest = xxhash.xxh64_intdigest(key)
+        if digest in self._pending:
+            return False
+        position = np.searchsorted(self._sorted, np.uint64(digest))
+        if position < len(self._sorted) and self._sorted[position] == digest:
+            return False
+        self._pending.add(digest)
+        if len(self._pending) >= self.MERGE_BATCH:
+            self._merge_pending()
+        return True
+
+    def _merge_pending(self) -> None:
+        batch = np.fromiter(
+            self._pending, dtype=np.uint64, count=len(self._pending)
+        )
+        self._sorted = np.union1d(self._sorted, batch)
+        self._pending.clear()
+
+
 def crack_target(
     target_path: Path,
     target_type: str,
     args: argparse.Namespace,
 ) -> Optional[str]:
-    attempted = 0
+    if target_type == "pdf" and args.engine == "pdfcrack":
+        # pdfcrack is a one-shot wordlist runner, not a per-candidate oracle.
+        if not args.wordlist or not args.wordlist.exists():
+            raise RuntimeError("--engine pdfcrack requires an existing --wordlist.")
+        return run_pdfcrack(target_path, args.wordlist)
 
-    def log_attempt(password: str) -> None:
-        nonlocal attempted
-        attempted += 1
-        if attempted % 500 == 0:
-            print(f"[+] Tried {attempted} candidates... last: {password}", flush=True)
-
-    candidate_streams: List[Iterable[str]] = []
+    # Streams carry (priority, candidate, exact-dedup) triples and are merged
+    # by priority, so likely hits (near-seed variants, the top of the
+    # wordlist) are tested before deep pattern expansion instead of after it.
+    candidate_streams: List[Iterable[tuple[int, Candidate, bool]]] = []
 
     if args.seed:
         candidate_streams.append(
-            limited(candidate_variants(args.seed), args.seed_variants)
+            (distance, candidate, True)
+            for distance, candidate in itertools.islice(
+                candidate_variants_ranked(args.seed), args.seed_variants
+            )
         )
 
     pattern_spec: Optional[str] = None
     if args.pattern or args.pattern_prefix or args.pattern_suffix:
         pattern_spec = f"{args.pattern_prefix}{args.pattern or ''}{args.pattern_suffix}"
 
+    prior = None
+    if args.wordlist_as_prior and args.wordlist and args.wordlist.exists():
+        prior = build_wordlist_prior(args.wordlist)
+
+    def brute_stream(generator: Iterable[Candidate]) -> Iterable[Candidate]:
+        stream = limited(generator, args.max_candidates)
+        if prior is not None:
+            stream = plausible_by_prior(stream, prior)
+        return stream
+
+    has_large_stream = False
     if pattern_spec:
+        has_large_stream = True
         candidate_streams.append(
-            limited(
-                generate_from_pattern(pattern_spec, order=args.pattern_order),
-                args.max_candidates,
+            prioritized(
+                brute_stream(
+                    generate_from_pattern(pattern_spec, order=args.pattern_order)
+                ),
+                PATTERN_PRIORITY_BUCKET,
+                exact=False,
             )
         )
     elif args.length:
+        has_large_stream = True
         candidate_streams.append(
-            limited(generate_by_length(args.length, args.charset), args.max_candidates)
+            prioritized(
+                brute_stream(generate_by_length(args.length, args.charset)),
+                PATTERN_PRIORITY_BUCKET,
+                exact=False,
+            )
         )
 
     if args.wordlist and args.wordlist.exists():
-        candidate_streams.append(read_wordlist(args.wordlist))
+        has_large_stream = True
+        candidate_streams.append(
+            prioritized(
+                read_wordlist(args.wordlist, start=args.restart_index),
+                WORDLIST_PRIORITY_BUCKET,
+                exact=False,
+            )
+        )
+
+    seen: Set[bytes] = set()
+    # For big brute-force spaces an exact set of long strings grows into
+    # hundreds of MB. Preferred bound: 8 bytes per candidate via sorted
+    # uint64 xxh64 digests; next a Bloom filter (~1e-6 false skips); an
+    # exact set of encoded candidates is the last resort.
+    bloom = None
+    hashes = None
+    if has_large_stream:
+        if np is not None and xxhash is not None:
+            hashes = _HashDedup()
+        elif ScalableBloomFilter is not None:
+            bloom = ScalableBloomFilter(
+                initial_capacity=args.max_candidates, error_rate=1e-6
+            )
 
-    seen: Set[str] = set()
-    for stream in candidate_streams:
-        for password in stream:
-            if password in seen:
+    def unique_candidates() -> Iterator[Candidate]:
+        merged = heapq.merge(*candidate_streams, key=lambda item: item[0])
+        for _, password, exact in merged:
+            # Streams may mix str and bytes; dedup on the encoded form.
+            key = _as_bytes(password)
+            if hashes is not None:
+                if not hashes.add(key):
+                    continue
+            elif key in seen or (bloom is not None and key in bloom):
                 continue
-            seen.add(password)
-            log_attempt(password)
-            if try_password(target_path, password, target_type):
-                return password
+            elif bloom is not None and not exact:
+                bloom.add(key)
+            else:
+                seen.add(key)
+            yield password
+
+    if args.workers > 1:
+        found = _crack_parallel(
+            unique_candidates(),
+            target_path,
+            target_type,
+            args.workers,
+            engine=args.engine,
+        )
+        return _as_str(found) if found is not None else None
+
+    cracker = make_cracker(target_path, target_type, engine=args.engine)
+    progress = _make_progress()
+    try:
+        for chunk in batched(unique_candidates(), _chunk_size_for(target_type)):
+            found = cracker.try_batch(chunk)
+            if found is not None:
+                return _as_str(found)
+            progress.update(len(chunk))
+    finally:
+        progress.close()
 
     return None
 